@@ -19,6 +19,7 @@ from botorch.acquisition.max_value_entropy_search import (
     qMultiFidelityMaxValueEntropy,
 )
 from botorch.exceptions.errors import UnsupportedError
+from botorch.generation.gen import gen_candidates_scipy
 from botorch.models.transforms.input import Warp
 from botorch.sampling.normal import SobolQMCNormalSampler
 from botorch.utils.datasets import SupervisedDataset
@@ -81,6 +82,115 @@ class MaxValueEntropySearchTest(TestCase):
                 )
             )
             mock_optimize_acqf.assert_called_once()
+            call_kwargs = mock_optimize_acqf.call_args.kwargs
+            self.assertEqual(call_kwargs["num_restarts"], 20)
+            self.assertEqual(call_kwargs["raw_samples"], 512)
+            self.assertEqual(call_kwargs["options"]["batch_limit"], 8)
+            self.assertEqual(call_kwargs["options"]["maxcor"], 20)
+            self.assertEqual(call_kwargs["options"]["maxls"], 10)
+            self.assertIs(call_kwargs["gen_candidates"], gen_candidates_scipy)
+            # the discrete candidate set is built on the model's dtype / device
+            acq_function = call_kwargs["acq_function"]
+            self.assertEqual(acq_function.candidate_set.dtype, self.tkwargs["dtype"])
+            self.assertEqual(
+                acq_function.candidate_set.device.type, self.tkwargs["device"].type
+            )
+            # quasi-random candidates are drawn within the search space bounds
+            candidate_set = acq_function.candidate_set[
+                : self.acq_options["candidate_size"]
+            ]
+            self.assertEqual(candidate_set.shape, torch.Size([100, 3]))
+            bounds = torch.tensor(self.bounds, **self.tkwargs).transpose(0, 1)
+            self.assertTrue(torch.all(candidate_set >= bounds[0]))
+            self.assertTrue(torch.all(candidate_set <= bounds[1]))
+
+        # more restarts are evaluated in parallel on CUDA; the bounds tensor is
+        # patched since CUDA may not actually be available
+        bounds_ = torch.tensor(self.bounds, **self.tkwargs).transpose(0, 1)
+        with mock.patch.object(
+            model, "device", torch.device("cuda")
+        ), mock.patch.object(
+            model, "_get_bounds_tensor", return_value=bounds_
+        ), mock.patch(
+            self.optimize_acqf
+        ) as mock_optimize_acqf:
+            mock_optimize_acqf.side_effect = [(new_X_dummy, None)]
+            model.gen(
+                n=1,
+                search_space_digest=self.search_space_digest,
+                torch_opt_config=torch_opt_config,
+            )
+            options = mock_optimize_acqf.call_args.kwargs["options"]
+            self.assertEqual(options["batch_limit"], 32)
+        self.assertEqual(model.device, self.tkwargs["device"])
+
+        # test sequential generation of multiple points
+        new_Xs_dummy = torch.rand(2, 3, **self.tkwargs)
+        with mock.patch(self.optimize_acqf) as mock_optimize_acqf:
+            mock_optimize_acqf.side_effect = [(new_Xs_dummy, None)]
+            gen_results = model.gen(
+                n=2,
+                search_space_digest=self.search_space_digest,
+                torch_opt_config=torch_opt_config,
+            )
+            self.assertTrue(torch.equal(gen_results.points, new_Xs_dummy))
+            mock_optimize_acqf.assert_called_once()
+            call_kwargs = mock_optimize_acqf.call_args.kwargs
+            self.assertEqual(call_kwargs["q"], 2)
+            self.assertTrue(call_kwargs["sequential"])
+            self.assertEqual(call_kwargs["raw_samples"], 512)
+
+        # L-BFGS-B specific options are only set when using L-BFGS-B
+        for method, expected in (("L-BFGS-B", True), ("SLSQP", False)):
+            with mock.patch(self.optimize_acqf) as mock_optimize_acqf:
+                mock_optimize_acqf.side_effect = [(new_X_dummy, None)]
+                model.gen(
+                    n=1,
+                    search_space_digest=self.search_space_digest,
+                    torch_opt_config=dataclasses.replace(
+                        torch_opt_config,
+                        model_gen_options={
+                            "acquisition_function_kwargs": self.acq_options,
+                            "optimizer_kwargs": {
+                                "options": {"method": method, "maxls": 5}
+                            },
+                        },
+                    ),
+                )
+                options = mock_optimize_acqf.call_args.kwargs["options"]
+                self.assertEqual(options["method"], method)
+                self.assertEqual(options["maxls"], 5)
+                self.assertEqual("maxcor" in options, expected)
+
+        # the candidate set is reproducible under `torch.manual_seed`
+        candidate_sets = []
+        for _ in range(2):
+            torch.manual_seed(0)
+            with mock.patch(self.optimize_acqf) as mock_optimize_acqf:
+                mock_optimize_acqf.side_effect = [(new_X_dummy, None)]
+                model.gen(
+                    n=1,
+                    search_space_digest=self.search_space_digest,
+                    torch_opt_config=torch_opt_config,
+                )
+                acq_function = mock_optimize_acqf.call_args.kwargs["acq_function"]
+                candidate_sets.append(acq_function.candidate_set)
+        self.assertTrue(torch.equal(*candidate_sets))
+
+        # the bounds tensor is cached and reused across `gen` calls
+        bounds_ = model._get_bounds_tensor(bounds=self.bounds)
+        self.assertIs(bounds_, model._bounds_tensor)
+        self.assertIs(model._get_bounds_tensor(bounds=self.bounds), bounds_)
+        self.assertTrue(
+            torch.equal(
+                bounds_, torch.tensor(self.bounds, **self.tkwargs).transpose(0, 1)
+            )
+        )
+        # only the most recent bounds are cached
+        new_bounds_ = model._get_bounds_tensor(bounds=[(0.0, 2.0)] * 3)
+        self.assertIsNot(new_bounds_, bounds_)
+        self.assertIs(model._bounds_tensor, new_bounds_)
+        self.assertIsNot(model._get_bounds_tensor(bounds=self.bounds), bounds_)
 
         # Check best point selection within bounds (some numerical tolerance)
         xbest = model.best_point(
@@ -16,7 +16,6 @@ from ax.models.torch.utils import (
 )
 from ax.models.torch_base import TorchGenResults, TorchModel, TorchOptConfig
 from ax.utils.common.docutils import copy_doc
-from ax.utils.common.typeutils import not_none
 from botorch.acquisition.acquisition import AcquisitionFunction
 from botorch.acquisition.cost_aware import InverseCostWeightedUtility
 from botorch.acquisition.max_value_entropy_search import (
@@ -28,9 +27,11 @@ from botorch.acquisition.utils import (
     project_to_target_fidelity,
 )
 from botorch.exceptions.errors import UnsupportedError
+from botorch.generation.gen import gen_candidates_scipy
 from botorch.models.cost import AffineFidelityCostModel
 from botorch.models.model import Model
 from botorch.optim.optimize import optimize_acqf
+from botorch.utils.sampling import draw_sobol_samples
 from torch import Tensor
 
 from .utils import subset_model
@@ -64,6 +65,10 @@ class MaxValueEntropySearch(BotorchModel):
             **kwargs,
         )
         self.cost_intercept = cost_intercept
+        # The bounds, dtype and device of the most recent `gen` call, and the
+        # corresponding `2 x d` bounds tensor that is reused while they match.
+        self._bounds_key: Optional[Tuple[Any, ...]] = None
+        self._bounds_tensor: Optional[Tensor] = None
 
     @copy_doc(TorchModel.gen)
     def gen(
@@ -118,17 +123,19 @@ class MaxValueEntropySearch(BotorchModel):
         num_mv_samples = acf_options.get("num_mv_samples", 10)
         num_y_samples = acf_options.get("num_y_samples", 128)
         candidate_size = acf_options.get("candidate_size", 1000)
-        num_restarts = optimizer_options.get("num_restarts", 40)
-        raw_samples = optimizer_options.get("raw_samples", 1024)
+        # L-BFGS-B refines each restart locally, so fewer initial samples and
+        # restarts are needed than for purely sample-based optimization
+        num_restarts = optimizer_options.get("num_restarts", 20)
+        raw_samples = optimizer_options.get("raw_samples", 512)
 
         # generate the discrete points in the design space to sample max values
-        bounds_ = torch.tensor(
-            search_space_digest.bounds, dtype=self.dtype, device=self.device
-        )
-        bounds_ = bounds_.transpose(0, 1)
+        bounds_ = self._get_bounds_tensor(bounds=search_space_digest.bounds)
 
-        candidate_set = torch.rand(candidate_size, bounds_.size(1))
-        candidate_set = bounds_[0] + (bounds_[1] - bounds_[0]) * candidate_set
+        # `SobolEngine` only runs on CPU, so `draw_sobol_samples` draws the points
+        # there and moves them to the device of `bounds_`.
+        candidate_set = draw_sobol_samples(
+            bounds=bounds_, n=candidate_size, q=1
+        ).squeeze(1)
 
         target_fidelities = {
             k: v
@@ -151,13 +158,20 @@ class MaxValueEntropySearch(BotorchModel):
 
         # optimize and get new points
         botorch_rounding_func = get_rounding_func(torch_opt_config.rounding_func)
+        on_cuda = self.device is not None and self.device.type == "cuda"
         opt_options: Dict[str, Union[bool, float, int, str]] = {
-            "batch_limit": 8,
+            # evaluate more restarts in parallel when running on a GPU
+            "batch_limit": 32 if on_cuda else 8,
             "maxiter": 200,
             "method": "L-BFGS-B",
             "nonnegative": False,
         }
         opt_options.update(optimizer_options.get("options", {}))
+        if opt_options["method"] == "L-BFGS-B":
+            # a larger L-BFGS-B memory converges in fewer iterations on the noisy
+            # MC-estimated MES surface, and capping line-search steps bounds the
+            # worst-case cost per iteration (unless overridden by the user)
+            opt_options = {"maxcor": 20, "maxls": 10, **opt_options}
         candidates, _ = optimize_acqf(
             acq_function=acq_function,
             bounds=bounds_,
@@ -169,12 +183,39 @@ class MaxValueEntropySearch(BotorchModel):
             raw_samples=raw_samples,
             options=opt_options,
             sequential=True,
+            # Always use the scipy-based candidate generation, since
+            # `gen_candidates_torch` evaluates the (expensive) MES acquisition
+            # function twice per optimization step.
+            gen_candidates=gen_candidates_scipy,
         )
         return TorchGenResults(
             points=candidates.detach().cpu(),
             weights=torch.ones(n, dtype=self.dtype),
         )
 
+    def _get_bounds_tensor(
+        self, bounds: List[Tuple[Union[int, float], Union[int, float]]]
+    ) -> Tensor:
+        """Get the `2 x d` tensor of lower and upper bounds on the model's dtype
+        and device, building it only if it differs from the last one built.
+
+        This mainly helps CUDA models, where building the tensor requires a
+        host-to-device copy; on CPU, the key comparison costs about as much as
+        building the tensor.
+        """
+        if self._bounds_tensor is not None and self._bounds_key == (
+            bounds,
+            self.dtype,
+            self.device,
+        ):
+            return self._bounds_tensor
+        bounds_ = torch.tensor(bounds, dtype=self.dtype, device=self.device)
+        bounds_ = bounds_.transpose(0, 1)
+        # copy `bounds`, so later in-place changes to it do not go unnoticed
+        self._bounds_key = (list(bounds), self.dtype, self.device)
+        self._bounds_tensor = bounds_
+        return bounds_
+
     def _get_best_point_acqf(
         self,
         X_observed: Tensor,
@@ -192,7 +233,8 @@ class MaxValueEntropySearch(BotorchModel):
             raise UnsupportedError("Outcome constraints not yet supported.")
 
         return get_out_of_sample_best_point_acqf(
-            model=not_none(self.model),
+            # `self.model` raises if the model has not been fit yet
+            model=self.model,
             Xs=self.Xs,
             objective_weights=objective_weights,
             # With None `outcome_constraints`, `get_objective` utility
@@ -200,7 +242,7 @@ class MaxValueEntropySearch(BotorchModel):
             # `get_out_of_sample_best_point_acqf` always selecting
             # `PosteriorMean`.
             outcome_constraints=outcome_constraints,
-            X_observed=not_none(X_observed),
+            X_observed=X_observed,
             seed_inner=seed_inner,
             fixed_features=fixed_features,
             fidelity_features=self.fidelity_features,
@@ -226,12 +268,16 @@ def _instantiate_MES(
     if target_fidelities:
         if fidelity_weights is None:
             fidelity_weights = {f: 1.0 for f in target_fidelities}
-        if not set(target_fidelities) == set(fidelity_weights):
+        target_fidelity_set = set(target_fidelities)
+        fidelity_weight_set = set(fidelity_weights)
+        if not target_fidelity_set == fidelity_weight_set:
             raise RuntimeError(
                 "Must provide the same indices for target_fidelities "
-                f"({set(target_fidelities)}) and fidelity_weights "
-                f" ({set(fidelity_weights)})."
+                f"({target_fidelity_set}) and fidelity_weights "
+                f" ({fidelity_weight_set})."
             )
+        # computed once here, as `expand` is called on every acquisition evaluation
+        fidelity_dims = sorted(target_fidelities)
         cost_model = AffineFidelityCostModel(
             fidelity_weights=fidelity_weights, fixed_cost=cost_intercept
         )
@@ -243,7 +289,7 @@ def _instantiate_MES(
         def expand(X: Tensor) -> Tensor:
             return expand_trace_observations(
                 X=X,
-                fidelity_dims=sorted(target_fidelities),  # pyre-ignore: [6]
+                fidelity_dims=fidelity_dims,
                 num_trace_obs=num_trace_observations,
             )
 
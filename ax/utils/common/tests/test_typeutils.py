@@ -4,6 +4,9 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import subprocess
+import sys
+from textwrap import dedent
 
 import numpy as np
 from ax.utils.common.testutils import TestCase
@@ -37,6 +40,10 @@ class TestTypeUtils(TestCase):
 
     def test_checked_cast_list(self) -> None:
         self.assertEqual(checked_cast_list(float, [1.0, 2.0]), [1.0, 2.0])
+        self.assertEqual(checked_cast_list(float, []), [])
+        # a new list is returned, even when no item needs to be re-checked
+        old_l = [1.0, 2.0]
+        self.assertIsNot(checked_cast_list(float, old_l), old_l)
         with self.assertRaises(ValueError):
             checked_cast_list(float, [1.0, 2])
 
@@ -47,6 +54,10 @@ class TestTypeUtils(TestCase):
 
     def test_checked_cast_dict(self) -> None:
         self.assertEqual(checked_cast_dict(str, int, {"some": 1}), {"some": 1})
+        self.assertEqual(checked_cast_dict(str, int, {}), {})
+        # a new dict is returned, even when no item needs to be re-checked
+        d = {"some": 1}
+        self.assertIsNot(checked_cast_dict(str, int, d), d)
         with self.assertRaises(ValueError):
             checked_cast_dict(str, int, {"some": 1.0})
         with self.assertRaises(ValueError):
@@ -55,3 +66,50 @@ class TestTypeUtils(TestCase):
     def test_numpy_type_to_python_type(self) -> None:
         self.assertEqual(type(numpy_type_to_python_type(np.int64(2))), int)
         self.assertEqual(type(numpy_type_to_python_type(np.float64(2))), float)
+        self.assertEqual(type(numpy_type_to_python_type(np.float32(2))), float)
+        self.assertEqual(type(numpy_type_to_python_type(np.bool_(True))), bool)
+        # non-numeric numpy scalars and python types are left unchanged
+        dt = np.datetime64("2020-01-01")
+        self.assertIs(numpy_type_to_python_type(dt), dt)
+        self.assertEqual(numpy_type_to_python_type("a"), "a")
+
+    def test_checked_casts_under_optimize(self) -> None:
+        # Under `python -O` the checked casts skip their checks, but return their
+        # input and keep their names.
+        code = dedent(
+            """
+            from ax.utils.common.typeutils import (
+                checked_cast,
+                checked_cast_dict,
+                checked_cast_list,
+                checked_cast_optional,
+                checked_cast_to_tuple,
+            )
+
+            assert checked_cast(float, 2) == 2
+            assert checked_cast_optional(float, 2) == 2
+            assert checked_cast_to_tuple((float,), "a") == "a"
+            old_l = [1, "a"]
+            new_l = checked_cast_list(float, old_l)
+            assert new_l == old_l and new_l is not old_l
+            d = {1: "a"}
+            new_d = checked_cast_dict(str, int, d)
+            assert new_d == d and new_d is not d
+            for f in (
+                checked_cast,
+                checked_cast_dict,
+                checked_cast_list,
+                checked_cast_optional,
+                checked_cast_to_tuple,
+            ):
+                assert f.__name__ == f.__wrapped__.__name__, f
+            print(checked_cast.__name__, checked_cast_to_tuple.__name__)
+            """
+        )
+        result = subprocess.run(
+            [sys.executable, "-O", "-c", code], capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        self.assertEqual(
+            result.stdout.split(), ["checked_cast", "checked_cast_to_tuple"]
+        )
@@ -4,6 +4,7 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+from functools import wraps
 from inspect import signature
 from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
 
@@ -16,6 +17,14 @@ K = TypeVar("K")
 X = TypeVar("X")
 Y = TypeVar("Y")
 
+# Whether the installed typeguard's `check_type` has the expected signature,
+# checked once rather than on every call to `version_safe_check_type`.
+_CHECK_TYPE_HAS_EXPECTED_SIGNATURE: bool = {
+    "argname",
+    "value",
+    "expected_type",
+}.issubset(signature(check_type).parameters)
+
 
 def not_none(val: Optional[T], message: Optional[str] = None) -> T:
     """
@@ -44,6 +53,7 @@ def checked_cast(typ: Type[T], val: V, exception: Optional[Exception] = None) ->
     Like `typing.cast`_ ``check_cast`` performs no runtime conversion on its argument,
     but, unlike ``typing.cast``, ``checked_cast`` will throw an error if the value is
     not of the expected type. The type passed as an argument should be a python class.
+    Under ``python -O`` no check is performed, and ``val`` is returned as is.
 
     Args:
         typ: the type to cast to
@@ -70,6 +80,9 @@ def checked_cast_optional(typ: Type[T], val: Optional[V]) -> Optional[T]:
 
 def checked_cast_list(typ: Type[T], old_l: List[V]) -> List[T]:
     """Calls checked_cast on all items in a list."""
+    if all(isinstance(val, typ) for val in old_l):
+        # pyre-fixme[7]: Expected `List[T]` but got `List[V]`.
+        return list(old_l)
     new_l = []
     for val in old_l:
         val = checked_cast(typ, val)
@@ -81,6 +94,12 @@ def checked_cast_dict(
     key_typ: Type[K], value_typ: Type[V], d: Dict[X, Y]
 ) -> Dict[K, V]:
     """Calls checked_cast on all keys and values in the dictionary."""
+    if all(
+        isinstance(key, key_typ) and isinstance(val, value_typ)
+        for key, val in d.items()
+    ):
+        # pyre-fixme[7]: Expected `Dict[K, V]` but got `Dict[X, Y]`.
+        return dict(d)
     new_dict = {}
     for key, val in d.items():
         val = checked_cast(value_typ, val)
@@ -95,7 +114,8 @@ def checked_cast_to_tuple(typ: Tuple[Type[V], ...], val: V) -> T:
     Cast a value to a union of multiple types (with a runtime safety check).
     This function is similar to `checked_cast`, but allows for the type to be
     defined as a tuple of types, in which case the value is cast as a union of
-    the types in the tuple.
+    the types in the tuple. Under ``python -O`` no check is performed, so this
+    should not be relied on to validate user input.
 
     Args:
         typ: the tuple of types to cast to
@@ -109,30 +129,65 @@ def checked_cast_to_tuple(typ: Tuple[Type[V], ...], val: V) -> T:
     return val
 
 
+if not __debug__:  # pragma: no cover
+    # Under `python -O` the checked casts above become identity functions (the
+    # list and dict variants still return a copy), skipping all runtime checks.
+    _checked_cast = checked_cast
+    _checked_cast_optional = checked_cast_optional
+    _checked_cast_list = checked_cast_list
+    _checked_cast_dict = checked_cast_dict
+    _checked_cast_to_tuple = checked_cast_to_tuple
+
+    @wraps(_checked_cast)
+    def checked_cast(  # noqa: F811
+        typ: Type[T], val: V, exception: Optional[Exception] = None
+    ) -> T:
+        # pyre-fixme[7]: Expected `T` but got `V`.
+        return val
+
+    @wraps(_checked_cast_optional)
+    def checked_cast_optional(  # noqa: F811
+        typ: Type[T], val: Optional[V]
+    ) -> Optional[T]:
+        # pyre-fixme[7]: Expected `Optional[T]` but got `Optional[V]`.
+        return val
+
+    @wraps(_checked_cast_list)
+    def checked_cast_list(typ: Type[T], old_l: List[V]) -> List[T]:  # noqa: F811
+        # pyre-fixme[7]: Expected `List[T]` but got `List[V]`.
+        return list(old_l)
+
+    @wraps(_checked_cast_dict)
+    def checked_cast_dict(  # noqa: F811
+        key_typ: Type[K], value_typ: Type[V], d: Dict[X, Y]
+    ) -> Dict[K, V]:
+        # pyre-fixme[7]: Expected `Dict[K, V]` but got `Dict[X, Y]`.
+        return dict(d)
+
+    @wraps(_checked_cast_to_tuple)
+    # pyre-fixme[34]: `T` isn't present in the function's parameters.
+    def checked_cast_to_tuple(typ: Tuple[Type[V], ...], val: V) -> T:  # noqa: F811
+        # pyre-fixme[7]: Expected `T` but got `V`.
+        return val
+
+
 def version_safe_check_type(argname: str, value: T, expected_type: Type[T]) -> None:
     """Excecute the check_type function if it has the expected signature, otherwise
     warn.  This is done to support newer versions of typeguard with minimal loss
     of functionality for users that have dependency conflicts"""
-    # Get the signature of the check_type function
-    sig = signature(check_type)
-    # Get the parameters of the check_type function
-    params = sig.parameters
-    # Check if the check_type function has the expected signature
-    params = set(params.keys())
-    if all(arg in params for arg in ["argname", "value", "expected_type"]):
+    if _CHECK_TYPE_HAS_EXPECTED_SIGNATURE:
         check_type(argname, value, expected_type)
 
 
 # pyre-fixme[3]: Return annotation cannot be `Any`.
 # pyre-fixme[2]: Parameter annotation cannot be `Any`.
 def numpy_type_to_python_type(value: Any) -> Any:
-    """If `value` is a Numpy int or float, coerce to a Python int or float.
-    This is necessary because some of our transforms return Numpy values.
+    """If `value` is a Numpy number or bool (e.g. int, float), coerce to the
+    corresponding Python type. This is necessary because some of our transforms
+    return Numpy values.
     """
-    if isinstance(value, np.integer):
-        value = int(value)  # pragma: nocover (covered by generator tests)
-    if isinstance(value, np.floating):
-        value = float(value)  # pragma: nocover  (covered by generator tests)
+    if isinstance(value, (np.number, np.bool_)):
+        return value.item()
     return value
 
 